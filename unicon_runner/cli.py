@@ -1,19 +1,20 @@
 import asyncio
+import contextlib
 import logging
+import signal
 from functools import partial
 from pathlib import Path
 from typing import Annotated
 
-import pika
 import pika.spec
 import typer
-from pika.adapters.blocking_connection import BlockingChannel
-from pika.exchange_type import ExchangeType
+from pika.channel import Channel
 from rich.logging import RichHandler
 
 from unicon_runner.executor import create_executor
 from unicon_runner.executor.base import Executor, ExecutorType, ProgramResult
-from unicon_runner.models import Job, JobResult, Program
+from unicon_runner.models import Job, JobResult
+from unicon_runner.mq import AsyncConsumer
 
 logging.basicConfig(
     level="INFO",
@@ -39,20 +40,20 @@ async def _run_job_async(executor: Executor, job: Job) -> JobResult:
     return JobResult(success=True, error=None, results=program_results, **_tracking_fields)
 
 
-def _run_job(executor: Executor, job: Job) -> JobResult:
+async def _run_job(executor: Executor, job: Job) -> JobResult:
     compatible, reason = executor.is_compatible(job.context)
     if not compatible:
         _tracking_fields = job.model_extra or {}
         return JobResult(success=False, error=reason, results=[], **_tracking_fields)
-    return asyncio.run(_run_job_async(executor, job))
+    return await _run_job_async(executor, job)
 
 
-def exec_pipeline(
-    in_ch: BlockingChannel,
+async def exec_pipeline(
+    in_ch: Channel,
     method: pika.spec.Basic.Deliver,
     _: pika.spec.BasicProperties,
     msg_body: bytes,
-    out_ch: BlockingChannel,
+    out_ch: Channel,
     executor: Executor,
 ) -> None:
     from unicon_runner.constants import AMQP_EXCHANGE_NAME, AMQP_RESULT_QUEUE_NAME
@@ -61,11 +62,12 @@ def exec_pipeline(
     job = Job.model_validate_json(msg_body)
     logger.info(f"Received job: {job.model_extra}")
 
-    result = _run_job(executor, job)
+    result = await _run_job(executor, job)
 
     logger.info(f"Pushing result: {result.model_extra}")
     out_ch.basic_publish(AMQP_EXCHANGE_NAME, AMQP_RESULT_QUEUE_NAME, result.model_dump_json())
 
+    assert method.delivery_tag is not None
     if not result.success:
         # If the job failed to run, only requeue if it has not been redelivered
         in_ch.basic_nack(delivery_tag=method.delivery_tag, requeue=not method.redelivered)
@@ -73,7 +75,7 @@ def exec_pipeline(
         in_ch.basic_ack(delivery_tag=method.delivery_tag)
 
 
-def init_mq() -> tuple[BlockingChannel, BlockingChannel]:
+async def serve(exec_type: ExecutorType, root_wd_dir: Path, concurrency: int) -> None:
     from unicon_runner.constants import (
         AMQP_CONN_NAME,
         AMQP_EXCHANGE_NAME,
@@ -85,21 +87,33 @@ def init_mq() -> tuple[BlockingChannel, BlockingChannel]:
     if AMQP_URL is None:
         raise RuntimeError("RABBITMQ_URL environment variable not defined")
 
-    conn_params = pika.URLParameters(AMQP_URL)
-    conn_params.client_properties = {"connection_name": AMQP_CONN_NAME}
-    conn = pika.BlockingConnection(conn_params)
+    # NOTE: `SIGINT` cancels the main task by default, handle `SIGTERM` the same way
+    # Cancelling the main task stops consumption and waits for in-flight jobs to finish
+    if (main_task := asyncio.current_task()) is not None:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main_task.cancel)
 
-    in_ch, out_ch = conn.channel(), conn.channel()
-    for ch in [in_ch, out_ch]:
-        ch.exchange_declare(exchange=AMQP_EXCHANGE_NAME, exchange_type=ExchangeType.topic)
+    consumer = AsyncConsumer(AMQP_URL, AMQP_CONN_NAME, concurrency)
+    await consumer.connect()
 
-    in_ch.queue_declare(queue=AMQP_TASK_QUEUE_NAME, durable=True)
-    in_ch.queue_bind(AMQP_TASK_QUEUE_NAME, AMQP_EXCHANGE_NAME, AMQP_TASK_QUEUE_NAME)
-
-    out_ch.queue_declare(queue=AMQP_RESULT_QUEUE_NAME, durable=True)
-    out_ch.queue_bind(AMQP_RESULT_QUEUE_NAME, AMQP_EXCHANGE_NAME, AMQP_RESULT_QUEUE_NAME)
+    executor = create_executor(exec_type, root_wd_dir)
+    logger.info(f"Created executor: [bold green]{executor.__class__.__name__}[/]")
+    logger.info(f"Root working directory: [bold green]{root_wd_dir.absolute()}[/]")
+    logger.info(f"Max concurrent jobs: [bold green]{concurrency}[/]")
 
-    return in_ch, out_ch
+    try:
+        in_ch, out_ch = await consumer.channel(), await consumer.channel()
+        await consumer.declare_queue(in_ch, AMQP_EXCHANGE_NAME, AMQP_TASK_QUEUE_NAME)
+        await consumer.declare_queue(out_ch, AMQP_EXCHANGE_NAME, AMQP_RESULT_QUEUE_NAME)
+        logger.info("Initialized task and result queues")
+
+        await consumer.consume(
+            in_ch,
+            AMQP_TASK_QUEUE_NAME,
+            partial(exec_pipeline, out_ch=out_ch, executor=executor),
+        )
+    finally:
+        await consumer.close()
+        await executor.aclose()
 
 
 RootWorkingDirectory = Annotated[
@@ -119,28 +133,16 @@ def main():
 
 
 @app.command()
-def start(exec_type: ExecutorType, root_wd_dir: RootWorkingDirectory) -> None:
-    from unicon_runner.constants import AMQP_TASK_QUEUE_NAME
-
+def start(
+    exec_type: ExecutorType,
+    root_wd_dir: RootWorkingDirectory,
+    concurrency: Annotated[
+        int, typer.Option(min=1, help="Maximum number of jobs to run concurrently")
+    ] = 1,
+) -> None:
     """Starts the unicon-runner service"""
-    in_ch, out_ch = init_mq()
-    logger.info("Initialized task and result queues")
-
-    executor = create_executor(exec_type, root_wd_dir)
-    logger.info(f"Created executor: [bold green]{executor.__class__.__name__}[/]")
-    logger.info(f"Root working directory: [bold green]{root_wd_dir.absolute()}[/]")
-
-    in_ch.basic_qos(prefetch_count=1)
-    in_ch.basic_consume(
-        AMQP_TASK_QUEUE_NAME,
-        on_message_callback=partial(exec_pipeline, out_ch=out_ch, executor=executor),
-        auto_ack=False,
-    )
-
-    try:
-        in_ch.start_consuming()  # NOTE: This is a blocking call (runs forever)
-    except KeyboardInterrupt:
-        in_ch.stop_consuming()
+    with contextlib.suppress(KeyboardInterrupt, asyncio.CancelledError):
+        asyncio.run(serve(exec_type, root_wd_dir, concurrency))
 
 
 @app.command()
@@ -171,13 +173,18 @@ def test(
 
     _console = Console()
 
-    async def _run_job(program: Program) -> ProgramResult:
-        # Since this is a test, we don't want to clean up the working directory
-        # This is so that we can easily inspect the files written and replay the execution
-        return await executor.run(program, job.context, cleanup=False, track_elapsed_time=True)
-
-    for i, program in enumerate(job.programs):
-        prog_result = asyncio.run(_run_job(program))
+    async def _run_programs() -> list[ProgramResult]:
+        try:
+            # Since this is a test, we don't want to clean up the working directory
+            # This is so that we can easily inspect the files written and replay the execution
+            return [
+                await executor.run(program, job.context, cleanup=False, track_elapsed_time=True)
+                for program in job.programs
+            ]
+        finally:
+            await executor.aclose()
+
+    for i, prog_result in enumerate(asyncio.run(_run_programs())):
         assert prog_result.elapsed_time_ns is not None
 
         tbl = Table(title=f"Program Result #{i + 1}", highlight=True)
@@ -26,3 +26,14 @@ CONTY_PATH: Final[str] = _get_env_var("CONTY_PATH", "conty.sh")
 CONTY_DOWNLOAD_URL: Final[str] = _get_env_var(
     "CONTY_DOWNLOAD_URL", "https://github.com/uniconhq/conty/releases/latest/download/conty.sh"
 )
+
+# Directory of the persistent venv cache shared across programs (disabled if empty)
+VENV_CACHE_DIR: Final[str] = _get_env_var("VENV_CACHE_DIR", "")
+VENV_CACHE_MAX_SIZE_MB: Final[int] = int(_get_env_var("VENV_CACHE_MAX_SIZE_MB", "10240"))
+
+# Number of idle containers kept warm per (image, memory limit) by `podman` executors (disabled if 0)
+PODMAN_POOL_SIZE: Final[int] = int(_get_env_var("PODMAN_POOL_SIZE", "0"))
+PODMAN_POOL_MAX_REUSE: Final[int] = int(_get_env_var("PODMAN_POOL_MAX_REUSE", "20"))
+PODMAN_POOL_IDLE_TIMEOUT_SECS: Final[float] = float(
+    _get_env_var("PODMAN_POOL_IDLE_TIMEOUT_SECS", "300")
+)
@@ -6,6 +6,8 @@ import shutil
 import stat
 import uuid
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from enum import Enum
 from pathlib import Path
 from typing import Final
@@ -14,6 +16,7 @@ import psutil
 from jinja2 import Environment, PackageLoader, select_autoescape
 
 from unicon_runner.constants import DEFAULT_SLURM_OPTS
+from unicon_runner.executor.venv_cache import PreparedVenv
 from unicon_runner.models import (
     ComputeContext,
     ExecutorPerf,
@@ -79,7 +82,9 @@ TIME_TRACKING_FILES: Final[dict[str, str]] = {
 
 def collect_perf_results(root: Path) -> ExecutorPerf:
     def get_time_ns(file_path: Path) -> int:
-        return int(file_path.read_text()) if file_path.read_text() else 0
+        # NOTE: Setup phases that are skipped (e.g. when using a prepared venv) leave no file behind
+        content = file_path.read_text() if file_path.exists() else ""
+        return int(content) if content else 0
 
     return ExecutorPerf(
         create_venv_ns=get_time_ns(root / TIME_TRACKING_FILES["create_venv_time_file"]),
@@ -98,12 +103,21 @@ class Executor(ABC):
         program: Program,
         context: ComputeContext,
         elapsed_time_tracking_files: dict[str, str] | None = None,
+        venv: PreparedVenv | None = None,
     ) -> FileSystemMapping:
         """
         Mapping of files (path, content) to be written to the working directory of the executor
         """
         raise NotImplementedError
 
+    @asynccontextmanager
+    async def environment(self, context: ComputeContext) -> AsyncIterator[PreparedVenv | None]:
+        """
+        Prepared environment that programs under the given context are run against
+        If none is yielded, the environment is set up as part of running the program instead
+        """
+        yield None
+
     @abstractmethod
     def _cmd(self, cwd: Path, program: Program, context: ComputeContext) -> ExecutorCmd:
         raise NotImplementedError
@@ -113,6 +127,73 @@ class Executor(ABC):
         exit_code = proc.returncode if proc.returncode is not None else 1
         return ExecutorResult(exit_code=exit_code, stdout=stdout.decode(), stderr=stderr.decode())
 
+    async def _spawn(self, cmd: list[str], env_vars: dict[str, str]) -> ExecutorResult:
+        logger.info(f"Process command: {cmd}")
+        logger.info(f"Env variables: {env_vars}")
+
+        return await self._collect(
+            await asyncio.create_subprocess_shell(
+                shlex.join(cmd),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env={**os.environ, **env_vars},
+            )
+        )
+
+    def _slurm_cmd(
+        self,
+        workspace: Path,
+        program: Program,
+        context: ComputeContext,
+        track_elapsed_time: bool,
+    ) -> ExecutorCmd:
+        # NOTE: For `slurm` execution, the working directory needs to be in NFS
+        # There will be 2 working directories:
+        # 1. NFS working directory (where the setup is done)
+        # 2. Slurm working directory (where the program is executed)
+        #   - This is hardcoded to `/tmp` for now
+        #   - A possible improvement is to introduce staging and execution directories
+        exec_dir = Path("/tmp") / workspace.name
+        prog_cmd, prog_env_vars = self._cmd(exec_dir, program, context)
+        logger.info(f"Program command: {prog_cmd}")
+
+        # Assemble the script that copies files from NFS to Slurm working directory
+        slurm_script = JINJA_ENV.get_template("slurm.sh.jinja").render(
+            staging_dir=str(workspace),
+            exec_dir=str(exec_dir),
+            exec_export_env_vars="\n".join(
+                [f"export {key}={value}" for key, value in prog_env_vars.items()]
+            ),
+            run_script=shlex.join(prog_cmd),
+            files_to_preserve=list(TIME_TRACKING_FILES.values()) if track_elapsed_time else [],
+        )
+        slurm_script_path = workspace / "slurm.sh"
+        slurm_script_path.write_text(slurm_script)
+        slurm_script_path.chmod(slurm_script_path.stat().st_mode | stat.S_IEXEC)
+
+        # NOTE: `--quiet` flag is used to suppress informational messages from `srun` being logged into stderr
+        # Errors will NOT be suppressed
+        slurm_options: list[str] = [DEFAULT_SLURM_OPTS, *context.slurm_options]
+        return ["srun", "--quiet", *slurm_options, str(slurm_script_path)], {}
+
+    async def _exec(
+        self,
+        workspace: Path,
+        program: Program,
+        context: ComputeContext,
+        track_elapsed_time: bool,
+    ) -> ExecutorResult:
+        """Runs the program materialized in `workspace`"""
+        if context.slurm:
+            cmd, env_vars = self._slurm_cmd(workspace, program, context, track_elapsed_time)
+        else:
+            cmd, env_vars = self._cmd(workspace, program, context)
+        return await self._spawn(cmd, env_vars)
+
+    async def aclose(self) -> None:
+        """Releases any resources held by the executor"""
+        return None
+
     def is_compatible(self, context: ComputeContext) -> tuple[bool, str]:
         # NOTE: We assume that as long as the working directory is on **any** NFS,
         # all nodes in the cluster will have access to it
@@ -126,12 +207,23 @@ class Executor(ABC):
         context: ComputeContext,
         cleanup: bool = True,
         track_elapsed_time: bool = True,
+    ) -> ProgramResult:
+        async with self.environment(context) as venv:
+            return await self._run(program, context, venv, cleanup, track_elapsed_time)
+
+    async def _run(
+        self,
+        program: Program,
+        context: ComputeContext,
+        venv: PreparedVenv | None,
+        cleanup: bool,
+        track_elapsed_time: bool,
     ) -> ProgramResult:
         _tracking_fields = program.model_extra or {}
         id: str = str(uuid.uuid4())  # Unique identifier for the program
         with ExecutorWorkspace(self._root_dir, id, cleanup) as workspace:
             for path, content, is_exec in self.get_filesystem_mapping(
-                program, context, TIME_TRACKING_FILES if track_elapsed_time else None
+                program, context, TIME_TRACKING_FILES if track_elapsed_time else None, venv
             ):
                 logger.info(f"Writing file: [magenta]{path}[/]")
                 file_path = workspace / path
@@ -140,57 +232,12 @@ class Executor(ABC):
                 if is_exec:
                     file_path.chmod(file_path.stat().st_mode | stat.S_IEXEC)
 
-            cmd: list[str]
-            env_vars: dict[str, str]
-
-            if context.slurm:
-                # NOTE: For `slurm` execution, the working directory needs to be in NFS
-                # There will be 2 working directories:
-                # 1. NFS working directory (where the setup is done)
-                # 2. Slurm working directory (where the program is executed)
-                #   - This is hardcoded to `/tmp` for now
-                #   - A possible improvement is to introduce staging and execution directories
-                exec_dir = Path("/tmp") / id
-                prog_cmd, prog_env_vars = self._cmd(exec_dir, program, context)
-                logger.info(f"Program command: {prog_cmd}")
-
-                # Assemble the script that copies files from NFS to Slurm working directory
-                slurm_script = JINJA_ENV.get_template("slurm.sh.jinja").render(
-                    staging_dir=str(workspace),
-                    exec_dir=str(exec_dir),
-                    exec_export_env_vars="\n".join(
-                        [f"export {key}={value}" for key, value in prog_env_vars.items()]
-                    ),
-                    run_script=shlex.join(prog_cmd),
-                    files_to_preserve=list(TIME_TRACKING_FILES.values())
-                    if track_elapsed_time
-                    else [],
-                )
-                slurm_script_path = workspace / "slurm.sh"
-                slurm_script_path.write_text(slurm_script)
-                slurm_script_path.chmod(slurm_script_path.stat().st_mode | stat.S_IEXEC)
-
-                # NOTE: `--quiet` flag is used to suppress informational messages from `srun` being logged into stderr
-                # Errors will NOT be suppressed
-                slurm_options: list[str] = [DEFAULT_SLURM_OPTS, *context.slurm_options]
-                cmd = ["srun", "--quiet", *slurm_options, str(slurm_script_path)]
-                env_vars = {}
-            else:
-                cmd, env_vars = self._cmd(workspace, program, context)
-
-            logger.info(f"Process command: {cmd}")
-            logger.info(f"Env variables: {env_vars}")
-
-            result = await self._collect(
-                await asyncio.create_subprocess_shell(
-                    shlex.join(cmd),
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    env={**os.environ, **env_vars},
-                )
-            )
+            result = await self._exec(workspace, program, context, track_elapsed_time)
 
             if perf := (collect_perf_results(workspace) if track_elapsed_time else None):
+                if venv is not None:
+                    perf.create_venv_ns = venv.create_venv_ns
+                    perf.install_deps_ns = venv.install_deps_ns
                 logger.info(f"[Setup] Create venv: {perf.create_venv_ns / 1e6:.4f}ms")
                 logger.info(f"[Setup] Install deps: {perf.install_deps_ns / 1e6:.4f}ms")
                 logger.info(f"[Program] Elapsed time: {perf.program_ns / 1e6:.4f}ms")
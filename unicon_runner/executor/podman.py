@@ -1,13 +1,36 @@
+import asyncio
+import shutil
 from pathlib import Path
 
-from unicon_runner.constants import DEFAULT_EXEC_PY_VERSION
+from unicon_runner.constants import (
+    DEFAULT_EXEC_PY_VERSION,
+    PODMAN_POOL_IDLE_TIMEOUT_SECS,
+    PODMAN_POOL_MAX_REUSE,
+    PODMAN_POOL_SIZE,
+)
 from unicon_runner.executor.base import Executor, ExecutorCmd, FileSystemMapping
-from unicon_runner.models import ComputeContext, Program
+from unicon_runner.executor.podman_pool import ContainerPool
+from unicon_runner.models import ComputeContext, ExecutorResult, Program
 
 
 class PodmanExecutor(Executor):
     """Uses podman + Dockerfile in template to execute code"""
 
+    IMAGE: str = f"python:{DEFAULT_EXEC_PY_VERSION}"
+
+    def __init__(self, root_dir: Path):
+        super().__init__(root_dir)
+        self._pool: ContainerPool | None = (
+            ContainerPool(
+                root_dir / ".podman-pool",
+                PODMAN_POOL_SIZE,
+                PODMAN_POOL_MAX_REUSE,
+                PODMAN_POOL_IDLE_TIMEOUT_SECS,
+            )
+            if PODMAN_POOL_SIZE > 0
+            else None
+        )
+
     def get_filesystem_mapping(self, program: Program, *_unused) -> FileSystemMapping:
         return [(Path(file.name), file.content, False) for file in program.files]
 
@@ -17,7 +40,33 @@ class PodmanExecutor(Executor):
             "podman", "run", "--rm",
             "-m", f"{context.memory_limit_mb}m",
             "-v", f"{cwd.absolute()}:/run",
-            f"python:{DEFAULT_EXEC_PY_VERSION}",
+            self.IMAGE,
             "timeout", "--verbose", f"{context.time_limit_secs}s", "python", f"/run/{program.entrypoint}",
         ], {}
         # fmt: on
+
+    async def _exec(
+        self,
+        workspace: Path,
+        program: Program,
+        context: ComputeContext,
+        track_elapsed_time: bool,
+    ) -> ExecutorResult:
+        if self._pool is None or context.slurm:
+            return await super()._exec(workspace, program, context, track_elapsed_time)
+
+        async with self._pool.lease(self.IMAGE, context.memory_limit_mb) as container:
+            await asyncio.to_thread(
+                shutil.copytree, workspace, container.workspace, dirs_exist_ok=True
+            )
+            # fmt: off
+            return await self._spawn([
+                "podman", "exec", container.name,
+                "timeout", "--verbose", f"{context.time_limit_secs}s",
+                "python", f"{ContainerPool.WORKSPACE}/{program.entrypoint}",
+            ], {})
+            # fmt: on
+
+    async def aclose(self) -> None:
+        if self._pool is not None:
+            await self._pool.aclose()
@@ -0,0 +1,204 @@
+import asyncio
+import contextlib
+import logging
+import shutil
+import time
+import uuid
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Coroutine
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("unicon_runner")
+
+# Label attached to all pooled containers, useful for cleaning up after a crashed runner
+POOL_LABEL = "unicon-runner.pool"
+
+# (image, memory limit in MB)
+PoolKey = tuple[str, int]
+
+
+@dataclass(eq=False)
+class PooledContainer:
+    name: str
+    key: PoolKey
+    # Host directory bind-mounted as the container's workspace (`WORKSPACE`)
+    workspace: Path
+    uses: int = 0
+    idle_since: float = field(default_factory=time.monotonic)
+
+
+async def _podman(*args: str) -> tuple[int, str]:
+    proc = await asyncio.create_subprocess_exec(
+        "podman", *args, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE
+    )
+    _, stderr = await proc.communicate()
+    return (proc.returncode if proc.returncode is not None else 1), stderr.decode().strip()
+
+
+class ContainerPool:
+    """
+    Pool of pre-started, idle containers that programs are dispatched into via `podman exec`
+
+    Containers are keyed by (image, memory limit) as the memory limit is applied at creation.
+    Only the workspace and temporary directories of a container are writable. Between uses,
+    all of its processes are killed and the writable directories are wiped; containers are
+    replaced once they have been used `max_reuse` times or have been idle for `idle_timeout_secs`.
+    """
+
+    WORKSPACE: str = "/workspace"
+
+    def __init__(self, root_dir: Path, size: int, max_reuse: int, idle_timeout_secs: float):
+        self._root_dir = root_dir
+        self._size = size
+        self._max_reuse = max_reuse
+        self._idle_timeout_secs = idle_timeout_secs
+
+        self._idle: dict[PoolKey, deque[PooledContainer]] = defaultdict(deque)
+        self._starting: dict[PoolKey, int] = defaultdict(int)
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._reaper: asyncio.Task[None] | None = None
+        self._closed: bool = False
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    async def _start(self, key: PoolKey) -> PooledContainer:
+        image, memory_limit_mb = key
+        name = f"unicon-{uuid.uuid4()}"
+        workspace = self._root_dir / name
+        workspace.mkdir(parents=True)
+
+        # fmt: off
+        exit_code, err = await _podman(
+            "run", "--detach", "--rm",
+            "--name", name,
+            "--label", POOL_LABEL,
+            "-m", f"{memory_limit_mb}m",
+            # NOTE: Only the workspace and temporary directories (tmpfs) are writable
+            # so that wiping them is enough to recycle the container
+            "--read-only",
+            "-v", f"{workspace.absolute()}:{self.WORKSPACE}",
+            "-w", self.WORKSPACE,
+            image,
+            "sleep", "infinity",
+        )
+        # fmt: on
+        if exit_code != 0:
+            shutil.rmtree(workspace, ignore_errors=True)
+            raise RuntimeError(f"Failed to start pooled container: {err}")
+        return PooledContainer(name, key, workspace)
+
+    async def _remove(self, container: PooledContainer) -> None:
+        await _podman("rm", "--force", "--time", "0", container.name)
+        await asyncio.to_thread(shutil.rmtree, container.workspace, ignore_errors=True)
+
+    async def _recycle(self, container: PooledContainer) -> bool:
+        # NOTE: `kill -9 -1` kills every process in the container except the caller and PID 1
+        exit_code, _ = await _podman(
+            "exec", container.name, "sh", "-c",
+            "kill -9 -1 2>/dev/null; find /tmp /var/tmp /dev/shm -mindepth 1 -delete",
+        )  # fmt: skip
+        if exit_code != 0:
+            return False
+
+        def _wipe_workspace() -> None:
+            for path in container.workspace.iterdir():
+                if path.is_dir() and not path.is_symlink():
+                    shutil.rmtree(path)
+                else:
+                    path.unlink()
+
+        try:
+            await asyncio.to_thread(_wipe_workspace)
+        except OSError:
+            return False
+        return True
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _replenish(self, key: PoolKey) -> None:
+        try:
+            container = await self._start(key)
+        except RuntimeError as err:
+            logger.warning(str(err))
+            return
+        finally:
+            self._starting[key] -= 1
+
+        if self._closed:
+            await self._remove(container)
+        else:
+            container.idle_since = time.monotonic()
+            self._idle[key].append(container)
+
+    def _fill(self, key: PoolKey) -> None:
+        """Starts containers in the background until the pool for `key` is full"""
+        if self._closed:
+            return
+        for _ in range(self._size - len(self._idle[key]) - self._starting[key]):
+            self._starting[key] += 1
+            self._spawn(self._replenish(key))
+
+    async def _release(self, container: PooledContainer, reusable: bool) -> None:
+        container.uses += 1
+        if (
+            reusable
+            and not self._closed
+            and container.uses < self._max_reuse
+            and len(self._idle[container.key]) < self._size
+            and await self._recycle(container)
+        ):
+            container.idle_since = time.monotonic()
+            self._idle[container.key].append(container)
+        else:
+            await self._remove(container)
+        self._fill(container.key)
+
+    async def _reap_idle(self) -> None:
+        while True:
+            await asyncio.sleep(max(self._idle_timeout_secs / 2, 1))
+            now = time.monotonic()
+            for idle in self._idle.values():
+                expired = [c for c in idle if now - c.idle_since > self._idle_timeout_secs]
+                for container in expired:
+                    idle.remove(container)
+                    self._spawn(self._remove(container))
+            logger.info(f"Container pool: {self.hits} hit(s), {self.misses} miss(es)")
+
+    @contextlib.asynccontextmanager
+    async def lease(self, image: str, memory_limit_mb: int) -> AsyncIterator[PooledContainer]:
+        """Leases a container to run a single program in, it is recycled or replaced afterwards"""
+        if self._reaper is None:
+            self._reaper = asyncio.create_task(self._reap_idle())
+
+        key: PoolKey = (image, memory_limit_mb)
+        if self._idle[key]:
+            self.hits += 1
+            container = self._idle[key].popleft()
+        else:
+            self.misses += 1
+            container = await self._start(key)
+        self._fill(key)
+
+        reusable = False
+        try:
+            yield container
+            reusable = True
+        finally:
+            # NOTE: Recycling happens in the background, off the critical path of the program
+            self._spawn(self._release(container, reusable))
+
+    async def aclose(self) -> None:
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        containers = [c for idle in self._idle.values() for c in idle]
+        self._idle.clear()
+        await asyncio.gather(*(self._remove(c) for c in containers), return_exceptions=True)
+        logger.info(f"Container pool: {self.hits} hit(s), {self.misses} miss(es)")
@@ -43,6 +43,8 @@ class SandboxExecutor(UnsafeExecutor):
             "--bind", *(["/tmp"] * 2),
             # R/W bind to the root working directory
             "--bind", *([str(cwd.parents[0].absolute())] * 2),
+            # NOTE: Cached venvs are shared across programs, they must not be writable from within
+            *(["--ro-bind", *([str(self._venv_cache.root)] * 2)] if self._venv_cache else []),
             # NOTE: Mount `procfs` to allow access to process information
             # This seems be required for GPU workloads
             "--proc", "/proc",
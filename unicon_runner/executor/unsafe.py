@@ -1,11 +1,17 @@
+import logging
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
 from pathlib import Path
 
 from jinja2 import Template
 
-from unicon_runner.constants import DEFAULT_EXEC_PY_VERSION
+from unicon_runner.constants import DEFAULT_EXEC_PY_VERSION, VENV_CACHE_DIR, VENV_CACHE_MAX_SIZE_MB
 from unicon_runner.executor.base import JINJA_ENV, Executor, ExecutorCmd, FileSystemMapping
+from unicon_runner.executor.venv_cache import PreparedVenv, VenvCache, VenvSetupError
 from unicon_runner.models import ComputeContext, Program
 
+logger = logging.getLogger("unicon_runner")
+
 
 class UnsafeExecutor(Executor):
     PYPROJECT_TEMPLATE: Template = JINJA_ENV.get_template("pyproject.toml.jinja")
@@ -13,19 +19,16 @@ class UnsafeExecutor(Executor):
 
     ENTRYPOINT: Path = Path("run.sh")
 
-    def get_filesystem_mapping(
-        self,
-        program: Program,
-        context: ComputeContext,
-        elapsed_time_tracking_files: dict[str, str] | None = None,
-    ) -> FileSystemMapping:
-        package_dir = Path("src")
-
-        # Assemble all requirements into `requirements.txt` format
-        requirements_txt: str = "\n".join(
-            (context.extra_options and context.extra_options.requirements) or []
+    def __init__(self, root_dir: Path):
+        super().__init__(root_dir)
+        self._venv_cache: VenvCache | None = (
+            VenvCache(Path(VENV_CACHE_DIR).absolute(), VENV_CACHE_MAX_SIZE_MB)
+            if VENV_CACHE_DIR
+            else None
         )
 
+    @staticmethod
+    def python_version(context: ComputeContext) -> str:
         python_version: str = DEFAULT_EXEC_PY_VERSION
         if context.slurm and context.slurm_use_system_py:
             # NOTE: We need to use the system python interpreter for slurm jobs
@@ -33,9 +36,40 @@ class UnsafeExecutor(Executor):
             python_version = "/usr/bin/python"
         elif context.extra_options:
             python_version = context.extra_options.version or python_version
+        return python_version
+
+    @asynccontextmanager
+    async def environment(self, context: ComputeContext) -> AsyncIterator[PreparedVenv | None]:
+        # NOTE: Slurm programs are set up on the compute node they are run on
+        if self._venv_cache is None or context.slurm:
+            yield None
+            return
+
+        requirements = (context.extra_options and context.extra_options.requirements) or []
+        async with AsyncExitStack() as stack:
+            venv: PreparedVenv | None = None
+            try:
+                venv = await stack.enter_async_context(
+                    self._venv_cache.acquire(self.python_version(context), requirements)
+                )
+            except VenvSetupError as err:
+                # Fallback to setting up the environment as part of the program run
+                # so that any setup errors are surfaced to the submitter
+                logger.warning(f"Failed to prepare cached venv: {err}")
+            yield venv
+
+    def get_filesystem_mapping(
+        self,
+        program: Program,
+        context: ComputeContext,
+        elapsed_time_tracking_files: dict[str, str] | None = None,
+        venv: PreparedVenv | None = None,
+    ) -> FileSystemMapping:
+        package_dir = Path("src")
 
         run_script = self.RUN_SCRIPT_TEMPLATE.render(
-            python_version=python_version,
+            python_version=self.python_version(context),
+            venv_python=str(venv.python) if venv else None,
             memory_limit_kb=context.memory_limit_mb * 1024,
             time_limit_secs=context.time_limit_secs,
             entry_point=str(package_dir / program.entrypoint),
@@ -43,12 +77,24 @@ class UnsafeExecutor(Executor):
             **(elapsed_time_tracking_files or {}),
         )
 
-        return [
+        program_files: FileSystemMapping = [
             *[(package_dir / file.name, file.content, False) for file in program.files],
             (package_dir / "__init__.py", "", False),
+            (self.ENTRYPOINT, run_script, True),
+        ]
+        if venv is not None:
+            # The environment is already set up, there is no need for project files
+            return program_files
+
+        # Assemble all requirements into `requirements.txt` format
+        requirements_txt: str = "\n".join(
+            (context.extra_options and context.extra_options.requirements) or []
+        )
+
+        return [
+            *program_files,
             (Path("pyproject.toml"), self.PYPROJECT_TEMPLATE.render(), False),
             (Path("requirements.txt"), requirements_txt, False),
-            (self.ENTRYPOINT, run_script, True),
         ]
 
     def _cmd(self, cwd: Path, *_unused) -> ExecutorCmd:
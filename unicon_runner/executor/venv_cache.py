@@ -0,0 +1,214 @@
+import asyncio
+import fcntl
+import hashlib
+import logging
+import os
+import shutil
+import time
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger("unicon_runner")
+
+
+@dataclass(frozen=True)
+class PreparedVenv:
+    """Python virtual environment with all requirements installed, ready to run programs"""
+
+    path: Path
+    # Time spent setting up the environment (zero if it was already set up)
+    create_venv_ns: int = 0
+    install_deps_ns: int = 0
+
+    @property
+    def python(self) -> Path:
+        return self.path / "bin" / "python"
+
+
+class VenvSetupError(RuntimeError):
+    pass
+
+
+def normalize_requirements(requirements: list[str]) -> list[str]:
+    """Canonical form of requirements: stripped, lowercased, deduplicated and sorted"""
+    return sorted(
+        {
+            " ".join(req.split()).lower()
+            for req in requirements
+            if req.strip() and not req.strip().startswith("#")
+        }
+    )
+
+
+async def create_venv(path: Path, python_version: str, requirements: list[str]) -> PreparedVenv:
+    """Creates a virtual environment at `path` and installs `requirements` into it"""
+
+    async def _uv(*args: str) -> int:
+        # NOTE: We need to unset VIRTUAL_ENV to prevent uv from using the wrong base python interpreter
+        env = {key: value for key, value in os.environ.items() if key != "VIRTUAL_ENV"}
+        proc = await asyncio.create_subprocess_exec(
+            "uv", "-q", *args, stderr=asyncio.subprocess.PIPE, env=env
+        )
+        _, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise VenvSetupError(f"`uv {' '.join(args)}` failed: {stderr.decode().strip()}")
+        return time.perf_counter_ns()
+
+    start_ns = time.perf_counter_ns()
+    venv_created_ns = await _uv("venv", "--python", python_version, str(path))
+    deps_installed_ns = venv_created_ns
+    if requirements:
+        requirements_txt = path / "requirements.txt"
+        requirements_txt.write_text("\n".join(requirements))
+        deps_installed_ns = await _uv(
+            "pip", "install", "--no-cache", "--python", str(path / "bin" / "python"),
+            "-r", str(requirements_txt),
+        )  # fmt: skip
+
+    return PreparedVenv(
+        path,
+        create_venv_ns=venv_created_ns - start_ns,
+        install_deps_ns=deps_installed_ns - venv_created_ns,
+    )
+
+
+class VenvCache:
+    """
+    Persistent, content-addressed cache of virtual environments
+
+    Environments are keyed by (python version, normalized requirements) and shared across
+    workspaces (and runner processes) through file locks:
+    - A shared lock is held on an entry for as long as it is in use
+    - An exclusive lock is held while an entry is being populated or evicted
+    Least recently used entries that are not in use are evicted once the cache exceeds its budget.
+    """
+
+    READY_MARKER: str = ".ready"
+
+    def __init__(self, root: Path, max_size_mb: int):
+        self._root = root
+        self._root.mkdir(parents=True, exist_ok=True)
+        self._max_size_bytes = max_size_mb * 1024 * 1024
+        # Serializes population of the same entry within this process
+        self._populate_locks: dict[str, asyncio.Lock] = {}
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @staticmethod
+    def key(python_version: str, requirements: list[str]) -> str:
+        digest = hashlib.sha256(python_version.encode())
+        for req in normalize_requirements(requirements):
+            digest.update(b"\n" + req.encode())
+        return digest.hexdigest()
+
+    def _lock_path(self, key: str) -> Path:
+        return self._root / f"{key}.lock"
+
+    def _is_ready(self, key: str) -> bool:
+        return (self._root / key / self.READY_MARKER).exists()
+
+    @asynccontextmanager
+    async def acquire(
+        self, python_version: str, requirements: list[str]
+    ) -> AsyncIterator[PreparedVenv]:
+        """Yields a ready environment, populating it first if it is not cached yet"""
+        key = self.key(python_version, requirements)
+        entry = self._root / key
+
+        lock_fd = os.open(self._lock_path(key), os.O_RDWR | os.O_CREAT)
+        try:
+            venv = PreparedVenv(entry)
+            while True:
+                await asyncio.to_thread(fcntl.flock, lock_fd, fcntl.LOCK_SH)
+                if self._is_ready(key):
+                    break
+
+                fcntl.flock(lock_fd, fcntl.LOCK_UN)
+                async with self._populate_locks.setdefault(key, asyncio.Lock()):
+                    await asyncio.to_thread(fcntl.flock, lock_fd, fcntl.LOCK_EX)
+                    try:
+                        if not self._is_ready(key):
+                            venv = await self._populate(key, python_version, requirements)
+                    finally:
+                        fcntl.flock(lock_fd, fcntl.LOCK_UN)
+                # NOTE: Readiness is re-checked under the shared lock
+                # in case the entry was evicted in between
+
+            # Touch the marker to keep track of recency for LRU eviction
+            os.utime(entry / self.READY_MARKER)
+            logger.info(f"Using cached venv: [magenta]{entry}[/]")
+            yield venv
+        finally:
+            os.close(lock_fd)  # Releases the lock
+
+    async def _populate(
+        self, key: str, python_version: str, requirements: list[str]
+    ) -> PreparedVenv:
+        entry = self._root / key
+        if entry.exists():  # Remnants of a failed population
+            await asyncio.to_thread(shutil.rmtree, entry)
+
+        logger.info(f"Populating venv cache entry: [magenta]{entry}[/]")
+        try:
+            venv = await create_venv(entry, python_version, normalize_requirements(requirements))
+        except BaseException:
+            await asyncio.to_thread(shutil.rmtree, entry, ignore_errors=True)
+            raise
+
+        size_bytes = await asyncio.to_thread(_dir_size, entry)
+        (entry / self.READY_MARKER).write_text(str(size_bytes))
+        await asyncio.to_thread(self.evict, exclude=key)
+        return venv
+
+    def evict(self, exclude: str | None = None) -> int:
+        """Evicts least recently used entries until the cache fits its budget"""
+        entries: list[tuple[float, int, str]] = []  # (last used, size, key)
+        for marker in self._root.glob(f"*/{self.READY_MARKER}"):
+            try:
+                entries.append(
+                    (marker.stat().st_mtime, int(marker.read_text() or 0), marker.parent.name)
+                )
+            except (OSError, ValueError):
+                continue
+
+        total_bytes = sum(size for _, size, _ in entries)
+        reclaimed_bytes = 0
+        for _, size, key in sorted(entries):
+            if total_bytes <= self._max_size_bytes:
+                break
+            if key == exclude:
+                continue
+
+            lock_fd = os.open(self._lock_path(key), os.O_RDWR | os.O_CREAT)
+            try:
+                # Entries in use (shared lock held) or being populated are skipped
+                fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(lock_fd)
+                continue
+
+            try:
+                # Move the entry out of the way first so that it is never seen half-deleted
+                trash = self._root / f".evicted-{uuid.uuid4()}"
+                (self._root / key).rename(trash)
+                shutil.rmtree(trash, ignore_errors=True)
+                total_bytes -= size
+                reclaimed_bytes += size
+                logger.info(f"Evicted venv cache entry: [magenta]{key}[/]")
+            finally:
+                os.close(lock_fd)
+
+        return reclaimed_bytes
+
+
+def _dir_size(path: Path) -> int:
+    return sum(
+        (Path(dirpath) / name).lstat().st_size
+        for dirpath, _, filenames in os.walk(path)
+        for name in filenames
+    )
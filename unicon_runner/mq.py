@@ -0,0 +1,135 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pika
+import pika.spec
+from pika.adapters.asyncio_connection import AsyncioConnection
+from pika.channel import Channel
+from pika.exchange_type import ExchangeType
+
+logger = logging.getLogger("unicon_runner")
+
+# (channel, method, properties, body) -> None
+MessageHandler = Callable[
+    [Channel, pika.spec.Basic.Deliver, pika.spec.BasicProperties, bytes], Awaitable[None]
+]
+
+
+async def _rpc(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Await a `pika` method that signals completion through its `callback` argument"""
+    fut: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+
+    def _on_done(frame: Any) -> None:
+        if not fut.done():
+            fut.set_result(frame)
+
+    method(*args, **kwargs, callback=_on_done)
+    return await fut
+
+
+class AsyncConsumer:
+    """
+    Task queue consumer running on a single, long-lived event loop
+
+    Up to `concurrency` messages are delivered (and handled) at once, each in its own task.
+    Messages are acknowledged by the handler on the channel they were delivered on.
+    """
+
+    def __init__(self, amqp_url: str, conn_name: str, concurrency: int):
+        self._conn_params = pika.URLParameters(amqp_url)
+        self._conn_params.client_properties = {"connection_name": conn_name}
+        self._concurrency = concurrency
+
+        self._conn: AsyncioConnection | None = None
+        self._closed: asyncio.Future[BaseException | None] | None = None
+        self._in_flight: set[asyncio.Task[None]] = set()
+
+    async def connect(self) -> AsyncioConnection:
+        loop = asyncio.get_running_loop()
+        opened: asyncio.Future[AsyncioConnection] = loop.create_future()
+        closed: asyncio.Future[BaseException | None] = loop.create_future()
+
+        def _on_open_error(_conn: AsyncioConnection, err: BaseException) -> None:
+            if not opened.done():
+                opened.set_exception(err)
+
+        def _on_close(_conn: AsyncioConnection, reason: BaseException) -> None:
+            if not opened.done():
+                opened.set_exception(reason)
+            if not closed.done():
+                closed.set_result(reason)
+
+        AsyncioConnection(
+            self._conn_params,
+            on_open_callback=opened.set_result,
+            on_open_error_callback=_on_open_error,
+            on_close_callback=_on_close,
+            custom_ioloop=loop,
+        )
+        self._conn, self._closed = await opened, closed
+        return self._conn
+
+    async def channel(self) -> Channel:
+        assert self._conn is not None, "Consumer is not connected"
+        opened: asyncio.Future[Channel] = asyncio.get_running_loop().create_future()
+        self._conn.channel(on_open_callback=opened.set_result)
+        return await opened
+
+    @staticmethod
+    async def declare_queue(ch: Channel, exchange: str, queue: str) -> None:
+        await _rpc(ch.exchange_declare, exchange=exchange, exchange_type=ExchangeType.topic)
+        await _rpc(ch.queue_declare, queue=queue, durable=True)
+        await _rpc(ch.queue_bind, queue, exchange, queue)
+
+    async def consume(self, ch: Channel, queue: str, on_message: MessageHandler) -> None:
+        """Consumes `queue` until the connection is closed or the consumer task is cancelled"""
+        assert self._closed is not None, "Consumer is not connected"
+
+        def _on_delivery(
+            delivery_ch: Channel,
+            method: pika.spec.Basic.Deliver,
+            props: pika.spec.BasicProperties,
+            body: bytes,
+        ) -> None:
+            task = asyncio.create_task(self._handle(on_message, delivery_ch, method, props, body))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+        # NOTE: The prefetch count bounds the number of unacknowledged deliveries,
+        # which in turn bounds the number of jobs being handled concurrently
+        await _rpc(ch.basic_qos, prefetch_count=self._concurrency)
+        consumer_tag = ch.basic_consume(queue, on_message_callback=_on_delivery, auto_ack=False)
+
+        try:
+            if reason := await self._closed:
+                raise RuntimeError(f"AMQP connection closed unexpectedly: {reason}")
+        finally:
+            if ch.is_open:
+                await _rpc(ch.basic_cancel, consumer_tag)
+            # Let in-flight jobs finish so that their results are published and acknowledged
+            if self._in_flight:
+                logger.info(f"Waiting for {len(self._in_flight)} in-flight job(s) to finish")
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def close(self) -> None:
+        if self._conn is not None and self._closed is not None and self._conn.is_open:
+            self._conn.close()
+            await self._closed
+
+    async def _handle(
+        self,
+        on_message: MessageHandler,
+        ch: Channel,
+        method: pika.spec.Basic.Deliver,
+        props: pika.spec.BasicProperties,
+        body: bytes,
+    ) -> None:
+        try:
+            await on_message(ch, method, props, body)
+        except Exception:
+            logger.exception(f"Failed to handle message (delivery tag: {method.delivery_tag})")
+            if ch.is_open and method.delivery_tag is not None:
+                # Only requeue if the message has not been redelivered to avoid poison messages
+                ch.basic_nack(delivery_tag=method.delivery_tag, requeue=not method.redelivered)